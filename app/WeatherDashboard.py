@@ -1,7 +1,6 @@
+from __future__ import annotations
 import streamlit as st
-import pandas as pd
-import altair as alt
-import requests, base64, mimetypes, uuid
+import base64, mimetypes, uuid
 from pathlib import Path
 from urllib.parse import urlencode
 from datetime import date, timedelta, datetime
@@ -9,7 +8,9 @@ from zoneinfo import ZoneInfo
 import streamlit.components.v1 as components
 
 st.set_page_config(page_title="Weather Trends — Live & Historical", layout="wide")
-alt.data_transformers.disable_max_rows()
+
+# pandas / Altair / requests are imported on first use, not at startup:
+# the hero renders before any data is loaded, and charts only for the open view.
 
 # ---------- City presets ----------
 CITIES = {
@@ -31,17 +32,30 @@ P_CSS  = BASE/"app/static/hero.css"
 BG_DIR = BASE/"app/static/hero_bg"
 JS_PATH= BASE/"app/static/hero.js"
 
-# ---------- CSS ----------
-def inject_css(path: Path) -> str:
+# ---------- lazy heavy modules ----------
+@st.cache_resource(show_spinner=False)
+def get_alt():
+    import altair as alt
+    alt.data_transformers.disable_max_rows()
+    return alt
+
+# ---------- assets (read once per process) ----------
+@st.cache_resource(show_spinner=False)
+def load_text(path: Path) -> str:
     try:
-        css = path.read_text(encoding="utf-8")
-        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
-        return css
+        return path.read_text(encoding="utf-8")
     except Exception:
         return ""
+
+# ---------- CSS ----------
+def inject_css(path: Path) -> str:
+    css = load_text(path)
+    if css:
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
+    return css
 CSS_TEXT = inject_css(P_CSS)
 
-# ---------- assets ----------
+@st.cache_resource(show_spinner=False)
 def load_bg_map() -> dict:
     out = {}
     for name in ["sunny","cloudy","rainy","snowy","storm"]:
@@ -55,12 +69,7 @@ def load_bg_map() -> dict:
     return out
 BG_MAP = load_bg_map()
 
-def load_js() -> str:
-    try:
-        return JS_PATH.read_text(encoding="utf-8")
-    except Exception:
-        return ""
-HERO_JS = load_js()
+HERO_JS = load_text(JS_PATH)
 
 # ---------- session helpers ----------
 def set_data(df: pd.DataFrame, source: str):
@@ -72,6 +81,7 @@ def get_data():
 # ---------- fetchers ----------
 @st.cache_data(show_spinner=False)
 def fetch_live_hourly(lat: float, lon: float, past_hours: int) -> pd.DataFrame:
+    import pandas as pd, requests
     base = "https://api.open-meteo.com/v1/forecast"
     params = {"latitude": lat, "longitude": lon, "hourly": "temperature_2m,precipitation,wind_speed_10m,snowfall",
               "timezone": "auto", "past_hours": past_hours, "forecast_hours": 0}
@@ -94,6 +104,7 @@ def fetch_live_hourly(lat: float, lon: float, past_hours: int) -> pd.DataFrame:
 
 @st.cache_data(show_spinner=False)
 def fetch_historical_daily(lat: float, lon: float, start: date, end: date) -> pd.DataFrame:
+    import pandas as pd, requests
     base = "https://archive-api.open-meteo.com/v1/archive"
     params = {"latitude": lat, "longitude": lon, "start_date": start.isoformat(), "end_date": end.isoformat(),
               "daily": "temperature_2m_max,temperature_2m_min,temperature_2m_mean,precipitation_sum,snowfall_sum,wind_speed_10m_mean",
@@ -114,6 +125,7 @@ def fetch_historical_daily(lat: float, lon: float, start: date, end: date) -> pd
 
 @st.cache_data(ttl=300, show_spinner=False)
 def fetch_current_conditions(lat: float, lon: float):
+    import requests
     base = "https://api.open-meteo.com/v1/forecast"
     params = {"latitude": lat, "longitude": lon, "timezone": "auto",
               "current_weather": "true",
@@ -150,6 +162,7 @@ def fetch_current_conditions(lat: float, lon: float):
 
 # ---------- transforms ----------
 def add_flags(df: pd.DataFrame) -> pd.DataFrame:
+    import pandas as pd
     df = df.copy()
     df["date"] = pd.to_datetime(df["date"])
     df["month"] = df["date"].dt.month
@@ -162,7 +175,12 @@ def add_flags(df: pd.DataFrame) -> pd.DataFrame:
     df["snow_day"]   = df["snowfall_sum_cm"] >= 1.0
     return df
 
+def read_daily_csv(path: Path) -> pd.DataFrame:
+    import pandas as pd
+    return add_flags(pd.read_csv(path, parse_dates=["date"]))
+
 def auto_granularity(df: pd.DataFrame) -> str:
+    import pandas as pd
     if df is None or not isinstance(df, pd.DataFrame) or df.empty or "date" not in df:
         return "Daily"
     span = (df["date"].max() - df["date"].min()).days + 1
@@ -214,6 +232,7 @@ def kpis_for_period(df: pd.DataFrame) -> dict:
 
 # ---------- charts ----------
 def temp_chart(df: pd.DataFrame, title: str):
+    alt = get_alt()
     folded = df[["date","temp_min_c","temp_mean_c","temp_max_c"]].melt("date", var_name="metric", value_name="value")
     color_scale = alt.Scale(domain=["temp_min_c","temp_mean_c","temp_max_c"], range=[COL["min"],COL["mean"],COL["max"]])
     base = alt.Chart(folded).mark_line().encode(
@@ -227,6 +246,7 @@ def temp_chart(df: pd.DataFrame, title: str):
     return base + smooth
 
 def bar_chart(df: pd.DataFrame, y_field: str, title: str, color: str):
+    alt = get_alt()
     return alt.Chart(df).mark_bar(color=color).encode(
         x=alt.X("date:T", axis=alt.Axis(labelOverlap=True)),
         y=f"{y_field}:Q",
@@ -234,6 +254,7 @@ def bar_chart(df: pd.DataFrame, y_field: str, title: str, color: str):
     ).properties(title=title, height=180)
 
 def line_chart(df: pd.DataFrame, y_field: str, title: str, color: str):
+    alt = get_alt()
     return alt.Chart(df).mark_line(color=color).encode(
         x=alt.X("date:T", axis=alt.Axis(labelOverlap=True)),
         y=f"{y_field}:Q",
@@ -241,6 +262,8 @@ def line_chart(df: pd.DataFrame, y_field: str, title: str, color: str):
     ).properties(title=title, height=180)
 
 def month_overlay_chart(d: pd.DataFrame, month_num: int):
+    import pandas as pd
+    alt = get_alt()
     m = d[d["month"] == month_num].copy()
     if m.empty: return alt.Chart(pd.DataFrame({"day":[1],"temp_mean_c":[0]})).mark_line()
     latest_year = int(m["year"].max())
@@ -254,6 +277,13 @@ def month_overlay_chart(d: pd.DataFrame, month_num: int):
     highlight = alt.Chart(m[m["year"]==latest_year]).mark_line(strokeWidth=3, color=COL["max"]).encode(x="day:O", y="temp_mean_c:Q")
     return base + highlight
 
+def overview_charts(daily: pd.DataFrame, agg: pd.DataFrame, granularity: str) -> list:
+    chart_temp = temp_chart(agg, f"Temperature — {granularity}")
+    chart_prec = bar_chart(agg, "precip_sum_mm", f"Precipitation — {granularity}", COL["rain"])
+    chart_snow = bar_chart(agg, "snowfall_sum_cm", f"Snowfall — {granularity}", COL["snow"]) if (daily["snowfall_sum_cm"].sum() or 0) > 0 else None
+    chart_wind = line_chart(agg, "wind_mean_kmh", f"Wind Speed — {granularity}", COL["wind"])
+    return [chart_temp, chart_prec, chart_snow, chart_wind]
+
 # ------------------- export (dashboard without Today) -------------------
 def build_dashboard_html_no_hero(kpi: dict, charts: list, granularity: str, css_text: str, title: str) -> bytes:
     chart_divs, scripts = [], []
@@ -308,10 +338,23 @@ def build_dashboard_html_no_hero(kpi: dict, charts: list, granularity: str, css_
     """
     return html.encode("utf-8")
 
-# ---------- hero component ----------
-import uuid
-import streamlit.components.v1 as components
+# Exports are rebuilt only when the data/granularity change, not on every rerun.
+@st.cache_data(show_spinner=False)
+def export_csv(daily: pd.DataFrame) -> bytes:
+    return daily.to_csv(index=False).encode("utf-8")
 
+@st.cache_data(show_spinner=False)
+def export_dashboard_html(daily: pd.DataFrame, granularity: str, css_text: str, title: str) -> bytes:
+    agg = resample_df(daily, granularity)
+    return build_dashboard_html_no_hero(
+        kpi=kpis_for_period(daily),
+        charts=overview_charts(daily, agg, granularity),
+        granularity=granularity,
+        css_text=css_text,
+        title=title
+    )
+
+# ---------- hero component ----------
 def render_today_hero(city_label: str, cur: dict, *, height_px: int = 320):
     cat  = (cur.get("category") or "sunny").lower()
     tz   = cur.get("timezone","local")
@@ -416,6 +459,7 @@ def render_today_hero(city_label: str, cur: dict, *, height_px: int = 320):
 def geocode_city(name: str, count: int = 5) -> list[dict]:
     """Return up to `count` matches for a city name using Open-Meteo’s geocoding API."""
     try:
+        import requests
         url = "https://geocoding-api.open-meteo.com/v1/search"
         params = {"name": name, "count": count, "language": "en", "format": "json"}
         r = requests.get(url, params=params, timeout=20, headers={"User-Agent":"AyushPortfolio/1.0"})
@@ -513,10 +557,10 @@ if load_clicked:
 
 if daily is None:
     if P_DAILY.exists():
-        daily = add_flags(pd.read_csv(P_DAILY, parse_dates=["date"]))
+        daily = read_daily_csv(P_DAILY)
         set_data(daily, f"Local file: {P_DAILY.name}")
     elif P_SAMP.exists():
-        daily = add_flags(pd.read_csv(P_SAMP, parse_dates=["date"]))
+        daily = read_daily_csv(P_SAMP)
         set_data(daily, f"Local file: {P_SAMP.name}")
 
 # ---------- Today hero ----------
@@ -533,7 +577,7 @@ except Exception:
 
 render_today_hero(city_label, cur, height_px=320)  
 # --- Safety: stop early if no dataset loaded yet ---
-if daily is None or (isinstance(daily, pd.DataFrame) and daily.empty):
+if daily is None or daily.empty:
     st.info("Choose a location and click **Load / Refresh** in the sidebar to fetch data.")
     st.stop()
 # ---------- Granularity ----------
@@ -544,16 +588,14 @@ with st.sidebar:
     granularity = auto_g if g == "Auto" else g
     st.caption(f"Auto picked: **{auto_g}** based on your date span.")
 
-agg = resample_df(daily, granularity)
-chart_temp = temp_chart(agg, f"Temperature — {granularity}")
-chart_prec = bar_chart(agg, "precip_sum_mm", f"Precipitation — {granularity}", COL["rain"])
-chart_snow = bar_chart(agg, "snowfall_sum_cm", f"Snowfall — {granularity}", COL["snow"]) if (daily["snowfall_sum_cm"].sum() or 0) > 0 else None
-chart_wind = line_chart(agg, "wind_mean_kmh", f"Wind Speed — {granularity}", COL["wind"])
+# ---------- Views ----------
+# st.tabs runs every tab body on each rerun; a selector lets us build only the open view.
+view = st.radio("View", ["Overview","Month view","Compare (YoY)","Climatology"],
+                horizontal=True, label_visibility="collapsed", key="view")
 
-# ---------- Tabs ----------
-tab_overview, tab_month, tab_compare, tab_climatology = st.tabs(["Overview","Month view","Compare (YoY)","Climatology"])
-
-with tab_overview:
+if view == "Overview":
+    agg = resample_df(daily, granularity)
+    chart_temp, chart_prec, chart_snow, chart_wind = overview_charts(daily, agg, granularity)
     k = kpis_for_period(daily)
 
     c1,c2,c3,c4,c5,c6 = st.columns(6)
@@ -582,19 +624,13 @@ with tab_overview:
         st.markdown('<div class="actions-right">', unsafe_allow_html=True)
         st.download_button(
             "Download daily CSV",
-            data=daily.to_csv(index=False).encode("utf-8"),
+            data=export_csv(daily),
             file_name=f"{city_label.replace(' ','_').lower()}_daily.csv",
             mime="text/csv",
             use_container_width=True,
         )
         title = f"Weather Dashboard — {city_label} ({daily['date'].min().date()} → {daily['date'].max().date()})"
-        html_bytes = build_dashboard_html_no_hero(
-            kpi=k,
-            charts=[chart_temp, chart_prec, chart_snow, chart_wind],
-            granularity=granularity,
-            css_text=CSS_TEXT,
-            title=title
-        )
+        html_bytes = export_dashboard_html(daily, granularity, CSS_TEXT, title)
         st.download_button(
             "Download dashboard (HTML)",
             data=html_bytes,
@@ -604,7 +640,7 @@ with tab_overview:
         )
         st.markdown('</div>', unsafe_allow_html=True)
 
-with tab_month:
+elif view == "Month view":
     months_present = sorted(daily["month"].unique().tolist())
     month_map = {1:"Jan",2:"Feb",3:"Mar",4:"Apr",5:"May",6:"Jun",7:"Jul",8:"Aug",9:"Sep",10:"Oct",11:"Nov",12:"Dec"}
     options = [f"{m:02d} — {month_map[m]}" for m in months_present] if months_present else ["—"]
@@ -614,7 +650,7 @@ with tab_month:
     st.altair_chart(month_overlay_chart(daily, month_num), use_container_width=True)
     st.altair_chart(bar_chart(daily[daily['month']==month_num], "precip_sum_mm", f"Precipitation — {month_map.get(month_num,'')}", COL['rain']), use_container_width=True)
 
-with tab_compare:
+elif view == "Compare (YoY)":
     if daily["year"].nunique() < 2:
         st.info("Load multiple years in Historical mode to compare year-over-year.")
     else:
@@ -628,6 +664,7 @@ with tab_compare:
                          rain_sum=("precip_sum_mm","sum"),
                          snow_sum=("snowfall_sum_cm","sum"))
                     .reset_index())
+        alt = get_alt()
         c1,c2,c3 = st.columns(3)
         c1.altair_chart(alt.Chart(yearly).mark_bar(color=COL["max"]).encode(x="year:O", y="temp_mean:Q"), use_container_width=True)
         c2.altair_chart(alt.Chart(yearly).mark_bar(color=COL["rain"]).encode(x="year:O", y="rain_sum:Q"), use_container_width=True)
@@ -636,7 +673,9 @@ with tab_compare:
         else:
             c3.info("No snow in the chosen month across the selected years.")
 
-with tab_climatology:
+elif view == "Climatology":
+    import pandas as pd
+    alt = get_alt()
     s = (daily.groupby(daily["month"])
            .agg(temp_min=("temp_min_c","mean"),
                 temp_mean=("temp_mean_c","mean"),
@@ -0,0 +1,74 @@
+"""Startup and rerun timings for the dashboard script.
+
+Runs app/WeatherDashboard.py headlessly through Streamlit's AppTest harness:
+
+  cold start  fresh interpreter, first script run (no data loaded yet)
+  rerun       same session re-executed with a multi-year dataset in state
+
+    python bench/bench_startup.py [--runs 5] [--reruns 20]
+"""
+import argparse, json, os, statistics, subprocess, sys, time
+from pathlib import Path
+
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+
+BASE = Path(__file__).resolve().parents[1]
+APP  = BASE/"app/WeatherDashboard.py"
+
+COLD = f"""
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({str(APP)!r}, default_timeout=120)
+t0 = time.perf_counter(); at.run(); t1 = time.perf_counter()
+print(json.dumps({{"seconds": t1 - t0, "altair": "altair" in sys.modules, "pandas": "pandas" in sys.modules}}))
+"""
+
+def sample_daily(years: int = 5):
+    import numpy as np, pandas as pd
+    dates = pd.date_range(end=pd.Timestamp.today().normalize() - pd.Timedelta(days=5), periods=365*years, freq="D")
+    rng   = np.random.default_rng(0)
+    doy   = dates.dayofyear.to_numpy()
+    mean  = 8 + 14*np.sin((doy - 110)/365*2*np.pi) + rng.normal(0, 3, len(dates))
+    return pd.DataFrame({
+        "date": dates,
+        "temp_mean_c": mean, "temp_min_c": mean - 5, "temp_max_c": mean + 5,
+        "precip_sum_mm": rng.gamma(0.6, 3, len(dates)),
+        "snowfall_sum_cm": np.where(mean < 0, rng.gamma(0.5, 2, len(dates)), 0.0),
+        "wind_mean_kmh": rng.uniform(5, 30, len(dates)),
+    })
+
+def cold_start(runs: int) -> dict:
+    out = []
+    for _ in range(runs):
+        res = subprocess.run([sys.executable, "-c", COLD], capture_output=True, text=True, check=True, cwd=BASE)
+        out.append(json.loads(res.stdout.strip().splitlines()[-1]))
+    secs = [o["seconds"] for o in out]
+    return {"median_s": statistics.median(secs), "min_s": min(secs),
+            "altair_imported": out[-1]["altair"], "pandas_imported": out[-1]["pandas"]}
+
+def reruns(n: int) -> dict:
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(str(APP), default_timeout=120)
+    at.run()
+    df = sample_daily()
+    # same derived columns as add_flags() in the app script
+    df["month"], df["year"], df["day"] = df["date"].dt.month, df["date"].dt.year, df["date"].dt.day
+    df["hot_day"], df["freeze_day"] = df["temp_max_c"] >= 30, df["temp_min_c"] <= 0
+    df["rain_day"], df["snow_day"]  = df["precip_sum_mm"] >= 1.0, df["snowfall_sum_cm"] >= 1.0
+    at.session_state["daily_df"] = df
+    at.session_state["data_source"] = "bench"
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    secs = []
+    for _ in range(n):
+        t0 = time.perf_counter(); at.run(); secs.append(time.perf_counter() - t0)
+    return {"median_s": statistics.median(secs), "min_s": min(secs)}
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--reruns", type=int, default=20)
+    a = ap.parse_args()
+    print("cold start:", json.dumps(cold_start(a.runs)))
+    print("rerun     :", json.dumps(reruns(a.reruns)))